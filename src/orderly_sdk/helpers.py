@@ -2,16 +2,44 @@
 """
 Helper functions for Orderly SDK.
 
-Provides utility functions for event loop management and async support.
+Provides utility functions for event loop management, async support and
+request signing.
 """
 
 import asyncio
+from typing import Callable
+
+import base58
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+try:
+    from based58 import b58decode as _native_b58decode
+except ImportError:  # optional, Rust backed base58
+    _native_b58decode = None
+
+try:
+    from pybase64 import b64encode  # noqa: F401
+except ImportError:  # optional, SIMD accelerated base64
+    from base64 import b64encode  # noqa: F401
+
+try:
+    from nacl.signing import SigningKey
+except ImportError:  # optional, libsodium backed signing
+    SigningKey = None
+
+try:
+    import uvloop
+except ImportError:  # optional, libuv based event loop
+    uvloop = None
 
 
 def get_loop():
     """
     Get or create an asyncio event loop for the current thread.
 
+    When a new loop has to be created it is a uvloop loop if uvloop is
+    installed, otherwise a default asyncio loop.
+
     Returns:
         asyncio.AbstractEventLoop: The event loop.
     """
@@ -20,8 +48,43 @@ def get_loop():
         return loop
     except RuntimeError as e:
         if str(e).startswith("There is no current event loop in thread"):
-            loop = asyncio.new_event_loop()
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             return loop
         else:
             raise
+
+
+def b58decode(value: str) -> bytes:
+    """
+    Decode a base58 string, using the native based58 package when installed.
+
+    Args:
+        value (str): Base58 encoded string.
+
+    Returns:
+        bytes: Decoded bytes.
+    """
+    if _native_b58decode is not None:
+        return _native_b58decode(value.encode())
+    return base58.b58decode(value)
+
+
+def load_ed25519_signer(orderly_secret: str) -> Callable[[bytes], bytes]:
+    """
+    Build an Ed25519 signing function from a base58 encoded Orderly secret.
+
+    Uses PyNaCl (libsodium) when it is installed and falls back to
+    cryptography otherwise.
+
+    Args:
+        orderly_secret (str): Base58 encoded Orderly secret.
+
+    Returns:
+        Callable[[bytes], bytes]: Function returning the raw 64-byte signature.
+    """
+    seed = b58decode(orderly_secret)[0:32]
+    if SigningKey is not None:
+        signing_key = SigningKey(seed)
+        return lambda data: signing_key.sign(data).signature
+    return Ed25519PrivateKey.from_private_bytes(seed).sign
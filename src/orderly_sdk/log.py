@@ -9,11 +9,14 @@ import sys
 
 from loguru import logger
 
-logger.add(
-    sys.stderr,
-    format='{{"timestamp":"{time}","level":"{level}","message":"{message}"}}',
-    level="INFO",
-)
+_FORMAT = '{{"timestamp":"{time}","level":"{level}","message":"{message}"}}'
+
+# drop loguru's default stderr sink, otherwise every record is printed twice
+try:
+    logger.remove(0)
+except ValueError:
+    pass
+_handler_id = logger.add(sys.stderr, format=_FORMAT, level="INFO")
 
 
 def set_level(level):
@@ -23,10 +26,9 @@ def set_level(level):
     Args:
         level (str): Log level (e.g., "INFO", "DEBUG").
     """
-    global logger
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        format='{{"timestamp":"{time}","level":"{level}","message":"{message}"}}',
-        level=level,
-    )
+    global _handler_id
+    try:
+        logger.remove(_handler_id)
+    except ValueError:  # already removed by the application
+        pass
+    _handler_id = logger.add(sys.stderr, format=_FORMAT, level=level)
@@ -6,22 +6,39 @@ This module provides the `AsyncClient` class for interacting with Orderly's REST
 Supports both public and private endpoints, with Ed25519 signature authentication for private endpoints.
 """
 
-import base64
-import datetime
-import json as jsonlib
-from collections import defaultdict
-from typing import Dict, Optional
+import asyncio
+import functools
+import time
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlencode, urlparse
 
 import aiohttp
-import base58
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+import orjson
+from yarl import URL
+
+try:
+    import httpx
+except ImportError:  # optional, only needed for transport="httpx"
+    httpx = None
 
 from .exceptions import OrderlyRequestException
-from .helpers import get_loop
+from .helpers import b64encode, load_ed25519_signer
 from .log import logger
 
 
+def _has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _json_dumps(obj) -> str:
+    """Serialize ``obj`` with orjson for aiohttp's ``json_serialize`` hook."""
+    return orjson.dumps(obj).decode()
+
+
 
 class AsyncClient:
     """
@@ -38,7 +55,9 @@ class AsyncClient:
         orderly_key (str, optional): API key for authentication.
         orderly_secret (str, optional): API secret for signing requests.
         endpoint (str, optional): REST API endpoint URL.
-        loop: Asyncio event loop.
+        loop: Asyncio event loop (optional, defaults to the running loop).
+        transport (str): HTTP transport, "aiohttp" (default, HTTP/1.1) or
+            "httpx" (HTTP/2, requires the `http2` extra).
     """
 
     _id: str
@@ -48,6 +67,8 @@ class AsyncClient:
     endpoint: Optional[str]
     api_version: str = "v1"
     timeout = 30
+    # signing payloads larger than this (bytes) are signed in a worker thread
+    sign_in_thread_threshold = 64 * 1024
 
     def __init__(
         self,
@@ -57,20 +78,42 @@ class AsyncClient:
         orderly_secret: Optional[str] = None,
         endpoint: Optional[str] = None,
         loop=None,
+        transport: str = "aiohttp",
     ):
         self._id = _id
         self.account_id = account_id
         self.orderly_key = orderly_key
         self.orderly_secret = orderly_secret
         if orderly_secret is not None:
-            self.orderly_private_key = Ed25519PrivateKey.from_private_bytes(
-                base58.b58decode(orderly_secret)[0:32]
-            )
+            self._sign = load_ed25519_signer(orderly_secret)
+        # headers that are identical on every signed request
+        self._static_signed_headers: Dict[str, str] = {
+            "orderly-key": f"ed25519:{orderly_key}",
+            "Cache-Control": "no-cache",
+        }
+        if account_id is not None:
+            self._static_signed_headers["orderly-account-id"] = account_id
         self.endpoint = endpoint
-        self.loop = loop or get_loop()
-        self.session = self._init_session()
-        self.headers: Dict[str, str] = defaultdict(str)
+        self._endpoint_path = urlparse(endpoint or "").path
+        self.loop = loop
+        self.session = None
+        self._request_fn = None
+        self._http_client = None
+        if transport == "httpx":
+            self._http_client = self._init_http_client()
+        elif transport == "aiohttp":
+            # without a loop to bind to, the session opens on the first request
+            if loop is not None or _has_running_loop():
+                self._open_session()
+        else:
+            raise ValueError(f"Unsupported transport: {transport}")
+        # ep/version -> (full uri, path used for signing)
+        self._rest_uri = functools.lru_cache(maxsize=512)(self._build_rest_uri)
         self.response = None
+        self._get = functools.partial(self._request_api, "get")
+        self._post = functools.partial(self._request_api, "post")
+        self._put = functools.partial(self._request_api, "put")
+        self._delete = functools.partial(self._request_api, "delete")
 
     def _get_headers(self) -> Dict:
         """Get default headers for HTTP requests."""
@@ -82,95 +125,156 @@ class AsyncClient:
         return headers
 
     def _init_session(self) -> aiohttp.ClientSession:
-        """Initialize aiohttp client session with default headers."""
-        return aiohttp.ClientSession(loop=self.loop, headers=self._get_headers())
+        """Initialize aiohttp client session with a pooled keep-alive connector."""
+        connector = aiohttp.TCPConnector(
+            loop=self.loop,
+            limit=0,
+            limit_per_host=256,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            force_close=False,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            loop=self.loop,
+            headers=self._get_headers(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            json_serialize=_json_dumps,
+        )
+
+    def _open_session(self):
+        self.session = self._init_session()
+        self._request_fn = self.session.request
+        return self._request_fn
+
+    def _init_http_client(self):
+        """Initialize httpx client with HTTP/2 multiplexing over one connection."""
+        if httpx is None:
+            raise ImportError(
+                'transport="httpx" requires httpx, install orderly-sdk[http2]'
+            )
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self._get_headers(),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+            timeout=self.timeout,
+        )
 
     async def close_connection(self):
         """
-        Close the underlying aiohttp session.
+        Close the underlying HTTP session.
         Call this when you are done with the client to free resources.
         """
         if self.session:
             assert self.session
             await self.session.close()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    def _sign_and_encode(self, data: bytes) -> str:
+        return b64encode(self._sign(data)).decode("ascii")
 
     async def _request(
         self,
         method,
         uri: str,
+        path: str,
         signed: bool,
-        params: Optional[Dict],
         json: Optional[Dict],
     ):
+        headers = None
+        data = None
         if signed:
-            ts = round(datetime.datetime.now().timestamp() * 1000)
-            json_str = ""
+            ts = str(time.time_ns() // 1_000_000)
             if json is not None:
-                logger.debug(f"request json body: {json}")
-                json_str = jsonlib.dumps(json)
-            path = urlparse(uri).path
-            if params:
-                query = urlencode(params)
-                path = f"{path}?{query}"
-            signature_str = f"{ts}{method.upper()}{path}{json_str}"
-            logger.debug(f"request signature: {signature_str}")
-            data_bytes = bytes(signature_str, "utf-8")
-
-            req_signature = base64.b64encode(
-                self.orderly_private_key.sign(data_bytes)
-            ).decode("utf-8")
-
-            self.headers["orderly-signature"] = req_signature
-            if self.account_id is not None:
-                self.headers["orderly-account-id"] = self.account_id
+                logger.opt(lazy=True).debug("request json body: {}", lambda: json)
+                # sign and send the same bytes instead of serializing twice
+                data = orjson.dumps(json)
+                json = None
+            data_bytes = b"".join(
+                (ts.encode(), method.upper().encode(), path.encode(), data or b"")
+            )
+            logger.opt(lazy=True).debug("request signature: {}", data_bytes.decode)
+
+            if len(data_bytes) > self.sign_in_thread_threshold:
+                signature = await asyncio.to_thread(self._sign_and_encode, data_bytes)
             else:
-                pass
-            self.headers["orderly-key"] = f"ed25519:{self.orderly_key}"
-            self.headers["orderly-timestamp"] = str(ts)
-            self.headers["Content-Type"] = (
-                "application/json" if json else "application/x-www-form-urlencoded"
+                signature = self._sign_and_encode(data_bytes)
+            headers = self._static_signed_headers.copy()
+            headers["orderly-signature"] = signature
+            headers["orderly-timestamp"] = ts
+            headers["Content-Type"] = (
+                "application/json" if data else "application/x-www-form-urlencoded"
             )
-            self.headers["Cache-Control"] = "no-cache"
-            self.session.headers.update(self.headers)
 
+        return await self._send(method, uri, headers, data=data, json=json)
+
+    async def _request_signed_simple(self, method: str, ep: str):
+        """Signed request without query or body, e.g. the arg-less private GETs."""
+        uri, path = self._rest_uri(ep, self.api_version)
+        ts = str(time.time_ns() // 1_000_000)
+        headers = self._static_signed_headers.copy()
+        headers["orderly-signature"] = self._sign_and_encode(
+            f"{ts}{method}{path}".encode()
+        )
+        headers["orderly-timestamp"] = ts
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return await self._send(method, uri, headers)
+
+    async def _send(self, method, uri: str, headers, data=None, json=None):
         logger.debug("request uri: {}", uri)
-        async with getattr(self.session, method)(
-            uri, params=params, json=json
-        ) as response:
+        if self._http_client is not None:
+            response = await self._http_client.request(
+                method, uri, content=data, json=json, headers=headers
+            )
             self.response = response
-            return await self._handle_response(response)
+            return self._handle_response(
+                response, response.is_success, response.content
+            )
+        request_fn = self._request_fn or self._open_session()
+        response = await request_fn(
+            method, URL(uri, encoded=True), data=data, json=json, headers=headers
+        )
+        self.response = response
+        try:
+            return self._handle_response(
+                response, 200 <= response.status < 300, await response.read()
+            )
+        finally:
+            response.release()
 
-    async def _handle_response(self, response: aiohttp.ClientResponse):
-        if not str(response.status).startswith("2"):
+    def _handle_response(self, response, ok: bool, body: bytes):
+        if not ok:
             logger.error("response: {}", response)
+        if not body:
+            return None
         try:
-            return await response.json()
+            return orjson.loads(body)
         except ValueError as exc:
-            txt = await response.text()
+            txt = body.decode("utf-8", "replace")
             raise OrderlyRequestException(f"Invalid Response: {txt}") from exc
 
-    def _create_rest_uri(self, ep: str, v: str = ""):
-        if not v:
-            v = self.api_version
-        return f"{self.endpoint}/{v}/{ep}"
+    def _build_rest_uri(self, ep: str, v: str) -> Tuple[str, str]:
+        return f"{self.endpoint}/{v}/{ep}", f"{self._endpoint_path}/{v}/{ep}"
 
     async def _request_api(
-        self, method, ep: str, signed: bool, v: str = "", params=None, json=None
+        self,
+        method,
+        ep: str,
+        signed: bool = False,
+        v: str = "",
+        params=None,
+        json=None,
+        query: str = "",
     ):
-        uri = self._create_rest_uri(ep, v)
-        return await self._request(method, uri, signed, params=params, json=json)
-
-    async def _get(self, ep, signed=False, v: str = "", params=None, json=None):
-        return await self._request_api("get", ep, signed, v, params, json)
-
-    async def _post(self, ep, signed=False, v: str = "", params=None, json=None):
-        return await self._request_api("post", ep, signed, v, params, json)
-
-    async def _put(self, ep, signed=False, v: str = "", params=None, json=None):
-        return await self._request_api("put", ep, signed, v, params, json)
-
-    async def _delete(self, ep, signed=False, v: str = "", params=None, json=None):
-        return await self._request_api("delete", ep, signed, v, params, json)
+        uri, path = self._rest_uri(ep, v or self.api_version)
+        if params:
+            query = urlencode(params, doseq=True)
+        if query:
+            # the exact query string that gets signed is also the one sent
+            uri = f"{uri}?{query}"
+            path = f"{path}?{query}"
+        return await self._request(method, uri, path, signed, json=json)
 
     async def get_maintenance_info(self) -> Dict:
         """
@@ -190,7 +294,7 @@ class AsyncClient:
             dict: User statistics.
         API doc: https://orderly.network/docs/build-on-evm/evm-api/restful-api/private/get-user-statistics
         """
-        return await self._get("client/statistics", True)
+        return await self._request_signed_simple("GET", "client/statistics")
 
     async def create_order(self, json: Dict) -> Dict:
         """
@@ -236,7 +340,7 @@ class AsyncClient:
             dict: All positions information.
         API doc: https://orderly.network/docs/build-on-evm/evm-api/restful-api/private/get-all-positions-info
         """
-        return await self._get("positions", True)
+        return await self._request_signed_simple("GET", "positions")
 
     async def get_liquidation(self, params) -> Dict:
         """
@@ -302,7 +406,7 @@ class AsyncClient:
             dict: Current holding info.
         API doc: https://orderly.network/docs/build-on-evm/evm-api/restful-api/private/get-current-holding
         """
-        return await self._get("client/holding", True)
+        return await self._request_signed_simple("GET", "client/holding")
 
     async def get_account_info(self) -> Dict:
         """
@@ -312,22 +416,20 @@ class AsyncClient:
             dict: Account info.
         API doc: https://orderly.network/docs/build-on-evm/evm-api/restful-api/private/get-account-information
         """
-        return await self._get("client/info", True)
+        return await self._request_signed_simple("GET", "client/info")
 
     async def batch_cancel_orders(self, order_ids: list) -> Dict:
         """
         Batch cancel orders (private endpoint).
 
         Args:
-            order_ids (list): List of order IDs to cancel.
+            order_ids (list): List of order IDs (str or int) to cancel.
         Returns:
             dict: Batch cancel result.
         API doc: https://orderly.network/docs/build-on-evm/evm-api/restful-api/private/batch-cancel-orders
         """
-        formatted_order_ids = ",".join(order_ids)
-        params = {"order_ids": formatted_order_ids}
-
-        return await self._delete("batch-order", True, params=params)
+        query = "order_ids=" + ",".join(map(str, order_ids))
+        return await self._delete("batch-order", True, query=query)
 
     async def get_order(self, order_id: str) -> Dict:
         """
@@ -6,21 +6,144 @@ This module provides public and private WebSocket managers for subscribing to re
 """
 
 import asyncio
-import base64
-import datetime
-import json as jsonlib
-from collections import defaultdict
-from typing import DefaultDict, Dict, Optional
+import collections
+import functools
+import time
+from typing import Any, Dict, Optional
 
-import base58
+import msgspec
+import orjson
 import websockets
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-from websockets import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
 
-from .helpers import get_loop
+from .helpers import b64encode, get_loop, load_ed25519_signer
 from .log import logger
 
 
+class WsMsg(msgspec.Struct, kw_only=True):
+    """Envelope of a frame received from the Orderly WebSocket API."""
+
+    event: Optional[str] = None
+    topic: Optional[str] = None
+    data: Any = None
+    ts: Optional[int] = None
+    success: Optional[bool] = None
+
+
+_DECODER = msgspec.json.Decoder(WsMsg)
+
+_PONG_FRAME = b'{"event":"pong"}'
+
+
+@functools.lru_cache(maxsize=512)
+def _topic_frame(_id: str, event: str, topic: str) -> bytes:
+    """Encoded subscribe/unsubscribe frame, cached since topics rarely change."""
+    return orjson.dumps({"id": _id, "event": event, "topic": topic})
+
+
+@functools.lru_cache(maxsize=512)
+def _orderbook_request_frame(_id: str, symbol: str) -> bytes:
+    """Encoded orderbook snapshot request for a symbol."""
+    return orjson.dumps(
+        {
+            "id": _id,
+            "event": "request",
+            "params": {"type": "orderbook", "symbol": symbol},
+        }
+    )
+
+
+class TopicRing:
+    """
+    Ring buffer holding the events of one topic.
+
+    The connection task pushes decoded messages and ``recv`` callers pop them;
+    several concurrent readers are woken in the order they started waiting,
+    as with `asyncio.Queue`. A full buffer doubles in size until it reaches `limit`; past that
+    the oldest message is overwritten, so a slow consumer always catches up on
+    the most recent market data. A capacity of 1 keeps only the latest value.
+
+    Args:
+        capacity (int): Number of buffered messages, rounded up to a power of two.
+        limit (int, optional): Largest capacity the buffer may grow to,
+            defaults to `capacity`.
+    """
+
+    __slots__ = ("buf", "head", "tail", "cap", "limit", "dropped", "waiters")
+
+    def __init__(self, capacity: int = 1024, limit: Optional[int] = None):
+        self.cap = 1 << (capacity - 1).bit_length()
+        self.limit = max(self.cap, 1 << (limit - 1).bit_length()) if limit else self.cap
+        self.buf: list = [None] * self.cap
+        self.head = 0
+        self.tail = 0
+        # messages overwritten before the consumer read them
+        self.dropped = 0
+        self.waiters: collections.deque[asyncio.Future] = collections.deque()
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def push(self, item) -> bool:
+        """
+        Append a message, dropping the oldest one when full.
+
+        Returns:
+            bool: Whether a buffered message was dropped.
+        """
+        dropped = False
+        if self.tail - self.head == self.cap:
+            if self.cap < self.limit:
+                self._grow()
+            else:
+                self.head += 1
+                self.dropped += 1
+                dropped = True
+        self.buf[self.tail & (self.cap - 1)] = item
+        self.tail += 1
+        self._wake_next()
+        return dropped
+
+    def _wake_next(self):
+        waiters = self.waiters
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _grow(self):
+        mask = self.cap - 1
+        self.buf = [self.buf[i & mask] for i in range(self.head, self.tail)]
+        self.buf += [None] * self.cap
+        self.tail -= self.head
+        self.head = 0
+        self.cap *= 2
+
+    async def get(self):
+        """Wait for and pop the oldest buffered message."""
+        while self.head == self.tail:
+            waiter = asyncio.get_running_loop().create_future()
+            self.waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    self.waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # pass on a wakeup that arrived just before the cancellation
+                if self.head != self.tail and not waiter.cancelled():
+                    self._wake_next()
+                raise
+        index = self.head & (self.cap - 1)
+        item = self.buf[index]
+        self.buf[index] = None
+        self.head += 1
+        return item
+
+
 
 class WsTopicManager:
     """
@@ -53,8 +176,22 @@ class WsTopicManager:
     """
 
     endpoint: str
-    queues: DefaultDict[str, asyncio.Queue]
-    websocket: WebSocketClientProtocol
+    queues: Dict[str, TopicRing]
+    topics: set[str]
+    websocket: ClientConnection
+    # topics whose consumers only need the latest value (snapshots, tickers)
+    latest_only_suffixes = ("bbos", "bbo", "orderbook", "24h_ticker", "24h_tickers")
+    # most messages buffered for any other topic before the oldest are dropped
+    max_backlog = 65536
+    # websockets.connect defaults tuned for market data, overridable in start()
+    connect_options: Dict[str, Any] = {
+        "compression": None,
+        "max_size": 2**22,
+        "max_queue": None,
+        "write_limit": 2**20,
+        "ping_interval": 10,
+        "ping_timeout": 10,
+    }
 
     def __init__(
         self,
@@ -67,38 +204,68 @@ class WsTopicManager:
         self.account_id = account_id
         self.endpoint = endpoint + self.account_id
         self.loop = loop or get_loop()
-        # topic -> topic event queue
-        self.queues: DefaultDict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        # topic -> topic event ring buffer
+        self.queues: Dict[str, TopicRing] = {}
+        # topics subscribed explicitly, the only ones resubscribed on reconnect
+        self.topics: set[str] = set()
+        self._last_recv = 0.0
+        # event -> control frame handler, other events are acknowledgements
+        self._handlers = {
+            "ping": self._handle_ping,
+            "pong": self._handle_pong,
+            "request": self._handle_request_orderbook,
+        }
 
     async def _connect(
         self,
         timeout: Optional[int | float] = None,
         **kwargs,
     ):
-        async for websocket in websockets.connect(self.endpoint, **kwargs):
+        loop = asyncio.get_running_loop()
+        options = {**self.connect_options, **kwargs}
+        async for websocket in websockets.connect(self.endpoint, **options):
+            watchdog = None
             try:
                 self.websocket = websocket
                 await self._reconnect()
-                logger.debug(f"Connected to {self.endpoint}")
+                logger.debug("Connected to {}", self.endpoint)
+                self._last_recv = loop.time()
+                if timeout is not None:
+                    watchdog = asyncio.create_task(self._watchdog(websocket, timeout))
                 while True:
-                    try:
-                        message = await asyncio.wait_for(
-                            websocket.recv(), timeout=timeout
-                        )
-                        await self._handle_heartbeat(message)
-                        # asyncio.create_task(self._handle_message(message))
-                        await self._handle_message(message)
-                    except asyncio.TimeoutError:
-                        logger.warning(f"Connection to {self.endpoint} timed out")
-                        break
+                    message = await websocket.recv(decode=False)
+                    self._last_recv = loop.time()
+                    # asyncio.create_task(self._handle_message(message))
+                    await self._handle_message(message)
             except websockets.ConnectionClosed:
-                logger.warning(f"Disconnected from {self.endpoint}")
+                logger.warning("Disconnected from {}", self.endpoint)
             except Exception as e:
                 logger.exception(e)
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+
+    async def _watchdog(self, websocket: ClientConnection, timeout: int | float):
+        # closes an idle connection so that _connect reconnects; a single
+        # task replaces arming a timer around every recv
+        loop = asyncio.get_running_loop()
+        while True:
+            idle = loop.time() - self._last_recv
+            if idle >= timeout:
+                logger.warning("Connection to {} timed out", self.endpoint)
+                await websocket.close()
+                return
+            await asyncio.sleep(timeout - idle)
 
     def start(self, timeout: Optional[int | float] = None, **kwargs):
         """
         Start the WebSocket connection in the event loop (non-blocking).
+
+        Args:
+            timeout (int | float, optional): Reconnect after this many seconds
+                without any frame from the server.
+            **kwargs: Options for `websockets.connect`, overriding
+                `connect_options` (no compression, 4 MiB frames, 10s pings).
         """
         self.loop.call_soon_threadsafe(
             asyncio.create_task, self._connect(timeout, **kwargs)
@@ -106,12 +273,15 @@ class WsTopicManager:
 
     def subscribe(self, topic):
         """
-        Subscribe to a topic (creates a queue for topic events).
+        Subscribe to a topic (creates a ring buffer for topic events).
+
+        Subscribing again keeps the existing buffer and any messages in it.
 
         Args:
             topic (str): Topic name.
         """
-        self.queues[topic] = asyncio.Queue()
+        self.topics.add(topic)
+        self._ring(topic)
 
     async def do_subscribe(self, topic):
         """
@@ -120,7 +290,24 @@ class WsTopicManager:
         Args:
             topic (str): Topic name.
         """
-        await self.send_json({"id": self._id, "event": "subscribe", "topic": topic})
+        logger.debug("subscribing to {} on {}", topic, self.endpoint)
+        await self.websocket.send(
+            _topic_frame(self._id, "subscribe", topic), text=True
+        )
+
+    async def subscribe_many(self, topics: list[str]):
+        """
+        Subscribe to several topics at once.
+
+        The subscribe requests are sent concurrently rather than one after
+        another.
+
+        Args:
+            topics (list[str]): Topic names.
+        """
+        for topic in topics:
+            self.subscribe(topic)
+        await asyncio.gather(*(self.do_subscribe(topic) for topic in topics))
 
     async def request(self, symbol: str):
         """
@@ -129,8 +316,12 @@ class WsTopicManager:
         Args:
             symbol (str): Market symbol.
         """
-        params = {"params": {"type": "orderbook", "symbol": symbol}}
-        await self.send_json({"id": self._id, "event": "request", **params})
+        # the response is routed to the symbol's orderbook topic
+        self._ring(f"{symbol}@orderbook")
+        logger.debug("requesting {} orderbook on {}", symbol, self.endpoint)
+        await self.websocket.send(
+            _orderbook_request_frame(self._id, symbol), text=True
+        )
 
     async def unsubscribe(self, topic):
         """
@@ -140,8 +331,9 @@ class WsTopicManager:
             topic (str): Topic name.
         """
         await self.websocket.send(
-            jsonlib.dumps({"id": self._id, "event": "unsubscribe", "topic": topic})
+            _topic_frame(self._id, "unsubscribe", topic), text=True
         )
+        self.topics.discard(topic)
         self.queues.pop(topic)
 
     async def send_json(self, message):
@@ -152,63 +344,98 @@ class WsTopicManager:
             message (dict): Message to send.
         """
         if "event" in message and message["event"] != "pong":
-            logger.debug(f"sending message to {self.endpoint}: {message}")
-        await self.websocket.send(jsonlib.dumps(message))
-
-    async def _handle_heartbeat(self, message):
-        message = jsonlib.loads(message)
-        if "event" in message:
-            if message["event"] == "ping":
-                await self.send_json({"event": "pong"})
-
-    async def _handle_request_orderbook(self, message: Dict):
-        topic = message["data"]["symbol"] + "@orderbook"
-        data = message["data"]
-        data["ts"] = message["ts"]
-        await self.queues[topic].put(data)
-
-    async def _handle_general_message(self, message: Dict):
-        data = message["data"]
-        # data["ts"] = message["ts"]
-        # logger.info(f"received message from {self.endpoint}: {message}")
-        await self.queues[message["topic"]].put(data)
-
-    async def recv(self, topic, timeout=10):
+            logger.debug("sending message to {}: {}", self.endpoint, message)
+        await self.websocket.send(orjson.dumps(message), text=True)
+
+    async def _handle_ping(self, message: WsMsg):
+        await self.websocket.send(_PONG_FRAME, text=True)
+
+    async def _handle_pong(self, message: WsMsg):
+        pass
+
+    async def _handle_ack(self, message: WsMsg):
+        if not message.success:
+            raise Exception(message)
+
+    async def _handle_request_orderbook(self, message: WsMsg):
+        if not message.success:
+            raise Exception(message)
+        data = message.data
+        if data is None:
+            return
+        topic = data["symbol"] + "@orderbook"
+        data["ts"] = message.ts
+        ring = self.queues.get(topic)
+        if ring is None:
+            logger.debug("dropping orderbook for unknown topic {}", topic)
+            return
+        ring.push(data)
+
+    async def _handle_general_message(self, message: WsMsg):
+        # logger.info("received message from {}: {}", self.endpoint, message)
+        if message.data is None:
+            return
+        ring = self.queues.get(message.topic)
+        if ring is None:
+            logger.debug("dropping message for unknown topic {}", message.topic)
+            return
+        if ring.push(message.data) and ring.limit > 1:
+            dropped = ring.dropped
+            # log at powers of two to keep a stalled consumer from flooding
+            if dropped & (dropped - 1) == 0:
+                logger.warning(
+                    "{} consumer is behind, dropped {} messages", message.topic, dropped
+                )
+
+    def _ring(self, topic) -> TopicRing:
+        ring = self.queues.get(topic)
+        if ring is None:
+            if topic.endswith(self.latest_only_suffixes):
+                ring = TopicRing(1)
+            else:
+                ring = TopicRing(1024, limit=self.max_backlog)
+            self.queues[topic] = ring
+        return ring
+
+    async def recv(self, topic, timeout: Optional[int | float] = None):
         """
-        Receive a message from a topic queue.
+        Receive a message from a topic buffer.
 
         Args:
             topic (str): Topic name.
-            timeout (int): Timeout in seconds.
+            timeout (int | float, optional): Timeout in seconds, waits
+                indefinitely if None.
         Returns:
-            dict: Message data.
+            dict | list: Message data as sent by the server (e.g. a list for
+                `bbos`).
+        Raises:
+            asyncio.TimeoutError: No message arrived within `timeout` seconds.
         """
-        res = None
-        while not res:
-            try:
-                res = await asyncio.wait_for(self.queues[topic].get(), timeout=timeout)
-            except asyncio.TimeoutError:
-                logger.info(f"no message in {timeout} seconds")
-        return res
-
-    async def _handle_message(self, message):
-        message = jsonlib.loads(message)
-        # logger.info(f"received message from {self.endpoint}: {message}")
-        if "event" in message:
-            if message["event"] not in ("ping", "pong"):
-                if message["success"]:
-                    if "data" in message and message["event"] == "request":
-                        await self._handle_request_orderbook(message)
-                    return
-                else:
-                    raise Exception(message)
-        if "data" in message:
+        ring = self._ring(topic)
+        try:
+            async with asyncio.timeout(timeout):
+                return await ring.get()
+        except asyncio.TimeoutError:
+            logger.info("no message in {} seconds", timeout)
+            raise
+
+    async def _handle_message(self, raw: bytes):
+        # Orderly's pings are compact and lead with the event key
+        if raw.startswith(b'{"event":"ping"'):
+            await self.websocket.send(_PONG_FRAME, text=True)
+            return
+        message = _DECODER.decode(raw)
+        # data frames carry no event, so skip the handler lookup for them
+        if message.event is None:
             await self._handle_general_message(message)
+            return
+        handler = self._handlers.get(message.event, self._handle_ack)
+        await handler(message)
 
     # reconnect, resubscribe
     async def _reconnect(self):
-        for topic in self.queues.keys():
-            await self.do_subscribe(topic)
+        topics = tuple(self.topics)
+        await asyncio.gather(*(self.do_subscribe(topic) for topic in topics))
 
 
 
@@ -236,9 +463,15 @@ class OrderlyPublicWsManager(WsTopicManager):
         ws.start()
         
         while True:
-            bbos_data = await ws.recv("bbos", timeout=30)
+            bbos_data = await ws.recv("bbos")
             print(f"Best prices: {bbos_data}")
         ```
+
+    Throughput of the stream depends heavily on the event loop. Install
+    uvloop (`pip install orderly-sdk[uvloop]`) and run your program with
+    `asyncio.run(main(), loop_factory=uvloop.new_event_loop)`. A manager
+    built in a thread without an event loop also gets a uvloop loop when
+    uvloop is installed.
     
     Args:
         _id (str): Client identifier.
@@ -370,30 +603,26 @@ class OrderlyPrivateWsManager(WsTopicManager):
         )
         self.orderly_key = orderly_key
         self.orderly_secret = orderly_secret
+        self._auth_key = f"ed25519:{orderly_key}"
         if orderly_secret is not None:
-            self.orderly_private_key = Ed25519PrivateKey.from_private_bytes(
-                base58.b58decode(orderly_secret)[0:32]
-            )
+            self._sign = load_ed25519_signer(orderly_secret)
 
-    def _signature(self, data):
+    def _signature(self, data: bytes) -> str:
         """Generate Ed25519 signature for authentication."""
-        data_bytes = bytes(str(data), "utf-8")
-        request_signature = base64.b64encode(
-            self.orderly_private_key.sign(data_bytes)
-        ).decode("utf-8")
-        return request_signature
+        # signed once per login, so it stays on the event loop
+        return b64encode(self._sign(data)).decode("ascii")
 
     async def _login(self) -> None:
         """Authenticate with the private WebSocket endpoint."""
-        ts = round(datetime.datetime.now().timestamp() * 1000)
+        timestamp = str(time.time_ns() // 1_000_000)
         await self.send_json(
             {
                 "id": self._id,
                 "event": "auth",
                 "params": {
-                    "orderly_key": f"ed25519:{self.orderly_key}",
-                    "sign": self._signature(ts),
-                    "timestamp": str(ts),
+                    "orderly_key": self._auth_key,
+                    "sign": self._signature(timestamp.encode()),
+                    "timestamp": timestamp,
                 },
             }
         )
@@ -434,9 +663,18 @@ class OrderlyPrivateWsManager(WsTopicManager):
         await self._login()
         await self.do_subscribe("pnl")
 
+    async def subscribe_many(self, topics: list[str]):
+        """
+        Authenticate once, then subscribe to several private topics at once.
+
+        Args:
+            topics (list[str]): Topic names.
+        """
+        await self._login()
+        await super().subscribe_many(topics)
+
     # reconnect, resubscribe
     async def _reconnect(self):
         """Reconnect and re-authenticate, then re-subscribe to all topics."""
-        for topic in self.queues.keys():
-            await self._login()
-            await self.do_subscribe(topic)
+        await self._login()
+        await super()._reconnect()